@@ -3,6 +3,9 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+import numpy as np
+import torch
+
 if TYPE_CHECKING:
     from finetuning_scripts.training_utils.ag_early_stopping import AdaptiveES
     from torch.optim.optimizer import Optimizer
@@ -13,16 +16,20 @@ class FineTuneStepResults:
     """Dataclass to store the results of a fine-tuning step."""
 
     # Minimal step results
-    training_loss: float
-    """The training loss of the current step."""
+    training_loss: float | torch.Tensor
+    """The training loss of the current step.
+
+    Kept as a tensor on the device until `materialize_step_results` to avoid a host
+    sync per step.
+    """
     device_utilization: float
     """The device utilization after the current step."""
     step_with_update: bool
     """Whether the optimizer, lr scheduler, and loss made a step."""
     optimizer_step_skipped: bool
     """Whether the optimizer step was skipped due to NaNs before grad scaling."""
-    grad_norm_before_clip: float
-    """The gradient norm before clipping."""
+    grad_norm_before_clip: float | torch.Tensor
+    """The gradient norm before clipping. Like `training_loss`, possibly a tensor."""
 
     # Optionally set by the loop
     step_index: int | None = None
@@ -69,6 +76,82 @@ class FineTuneStepResults:
         }
 
 
+def materialize_step_results(step_results: list[FineTuneStepResults]) -> None:
+    """Convert all tensors in the step results to floats in-place with one host sync."""
+    pending = [
+        (step, name)
+        for step in step_results
+        for name in ("training_loss", "grad_norm_before_clip")
+        if isinstance(getattr(step, name), torch.Tensor)
+    ]
+    if not pending:
+        return
+
+    values = torch.stack(
+        [getattr(step, name).float() for step, name in pending],
+    ).tolist()
+    for (step, name), value in zip(pending, values, strict=True):
+        setattr(step, name, value)
+
+
+@dataclass
+class ValidationData:
+    """The data used for validation, kept on the device for the whole fine-tuning.
+
+    All tensors are contiguous float32 tensors of shape (n_samples, 1, n_features or 1).
+    """
+
+    X_train: torch.Tensor
+    """The training (in-context) features."""
+    y_train: torch.Tensor
+    """The training (in-context) target."""
+    X_val: torch.Tensor
+    """The validation features."""
+    y_val: torch.Tensor
+    """The validation target."""
+
+
+class FineTuneTrace:
+    """Trace of the results of all fine-tuning steps.
+
+    Stores the results needed after fine-tuning in preallocated arrays (one entry per
+    step) instead of keeping a list of `FineTuneStepResults`.
+
+    Arguments:
+    ----------
+    max_steps: int
+        The maximal number of steps to trace.
+    """
+
+    def __init__(self, *, max_steps: int):
+        self.n_steps = 0
+        self._training_loss = np.empty(max_steps, dtype=np.float64)
+        self._validation_loss = np.empty(max_steps, dtype=np.float64)
+        self._device_utilization = np.empty(max_steps, dtype=np.float64)
+
+    def append(self, step_results: FineTuneStepResults) -> None:
+        """Add the (materialized) results of the next step."""
+        self._training_loss[self.n_steps] = step_results.training_loss
+        self._validation_loss[self.n_steps] = step_results.validation_loss
+        self._device_utilization[self.n_steps] = step_results.device_utilization
+        self.n_steps += 1
+
+    @property
+    def training_loss(self) -> np.ndarray:
+        """The training loss per step (view)."""
+        return self._training_loss[: self.n_steps]
+
+    @property
+    def validation_loss(self) -> np.ndarray:
+        """The validation loss per step (view)."""
+        return self._validation_loss[: self.n_steps]
+
+    @property
+    def device_utilization(self) -> np.ndarray:
+        """The device utilization per step (view)."""
+        return self._device_utilization[: self.n_steps]
+
+
 @dataclass
 class FineTuneSetup:
     """Configuration for fine-tuning a model."""
@@ -88,12 +171,21 @@ class FineTuneSetup:
 
     update_every_n_steps: int
     """The number of steps to update the model before validation"""
+    effective_batch_size: int
+    """The number of datasets per update over all accumulated steps and processes."""
     validate_every_n_steps: int
     """The number of steps to validate the model"""
 
     data_loader_workers: int
     """The number of workers for the data loader."""
 
+    use_gradient_checkpointing: bool
+    """Whether to recompute activations during the backward pass to save memory."""
+    validate_in_background: bool
+    """Whether to validate a snapshot of the model in the background during training."""
+    compile_model: bool
+    """Whether to compile the model with torch.compile for training (GPU only)."""
+
     @property
     def report_str(self):
         return f"""
@@ -103,4 +195,8 @@ class FineTuneSetup:
             \tMax Steps: {self.max_steps}
             \tAdaptiveES: Adaptive Rate {self.adaptive_es.adaptive_rate} | Min Patience {self.adaptive_es.min_patience} | Max Patience {self.adaptive_es.max_patience}
             \tUpdate Every N Steps: {self.update_every_n_steps} | Validate Every N Steps: {self.validate_every_n_steps}
+            \tEffective Batch Size: {self.effective_batch_size}
+            \tGradient Checkpointing: {self.use_gradient_checkpointing}
+            \tValidate in Background: {self.validate_in_background}
+            \tCompile Model: {self.compile_model}
         """
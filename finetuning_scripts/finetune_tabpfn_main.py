@@ -2,10 +2,12 @@ from __future__ import annotations
 
 import logging
 import random
+import socket
 import time
 import warnings
 from collections.abc import Callable
-from copy import deepcopy
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from functools import partial
 from pathlib import Path
 from typing import TYPE_CHECKING, Literal, Union, Sequence
@@ -20,19 +22,40 @@ from finetuning_scripts.constant_utils import (
     SupportedValidationMetric,
     TaskType,
 )
-from finetuning_scripts.data_classes import FineTuneSetup, FineTuneStepResults
+from finetuning_scripts.data_classes import (
+    FineTuneSetup,
+    FineTuneStepResults,
+    FineTuneTrace,
+    ValidationData,
+    materialize_step_results,
+)
 from finetuning_scripts.metric_utils.ag_metrics import get_metric
 from finetuning_scripts.training_utils.ag_early_stopping import AdaptiveES
-from finetuning_scripts.training_utils.data_utils import get_data_loader
-from finetuning_scripts.training_utils.model_utils import save_model
+from finetuning_scripts.training_utils.background_validation import (
+    BackgroundValidator,
+)
+from finetuning_scripts.training_utils.data_utils import (
+    get_data_loader,
+    get_n_classes,
+    unpack_batch,
+)
+from finetuning_scripts.training_utils.device_utils import get_device_utilization
+from finetuning_scripts.training_utils.model_utils import (
+    BackgroundModelSaver,
+    save_model,
+    unwrap_model,
+)
 from finetuning_scripts.training_utils.training_loss import compute_loss, get_loss
-from finetuning_scripts.training_utils.validation_utils import validate_tabpfn
+from finetuning_scripts.training_utils.validation_utils import (
+    to_validation_tensor,
+    validate_tabpfn,
+)
 from schedulefree import AdamWScheduleFree
 from tabpfn import TabPFNClassifier, TabPFNRegressor
 from tabpfn.base import load_model_criterion_config
 from torch import autocast
 from torch.cuda.amp import GradScaler
-from torch.nn import DataParallel
+from torch.nn.parallel import DistributedDataParallel
 from tqdm import tqdm
 
 if TYPE_CHECKING:
@@ -64,6 +87,7 @@ def fine_tune_tabpfn(
     categorical_features_index: list[int] | None,
     task_type: TaskType,
     device: SupportedDevice,
+    n_classes: int | None = None,
     use_multiple_gpus: bool = False,
     multiple_device_ids: Sequence[Union[int, torch.device]] | None  = None,
     X_val: pd.DataFrame | np.ndarray | None = None,
@@ -73,6 +97,7 @@ def fine_tune_tabpfn(
     logger_level: int = 20,
     show_training_curve: bool = False,
     use_wandb: bool = False,
+    wandb_init_kwargs: dict | None = None,
     use_sklearn_interface_for_validation: bool = False,
     model_for_validation: TabPFNClassifier | TabPFNRegressor = None
 ) -> None:
@@ -105,8 +130,14 @@ def fine_tune_tabpfn(
         The task type of the problem.
     device: SupportedDevice
         The device to use for fine-tuning.
+    n_classes: int | None
+        Optional number of classes for classification tasks. If None, it is inferred
+        from `y_train`.
     use_multiple_gpus: bool
-        If True, will use multiple GPUs for fine-tuning.
+        If True, will use multiple GPUs for fine-tuning with DistributedDataParallel.
+        Spawns one process per GPU, so all inputs must be picklable. If the default
+        process group is already initialized (e.g., via torchrun), the current
+        process is used as one of the workers instead.
     multiple_device_ids: Sequence[Union[int, torch.device]] | None
         GPU ids to use when use_multiple_gpus is True.
         Will use all available GPUs if None.
@@ -123,6 +154,10 @@ def fine_tune_tabpfn(
     use_wandb: bool
         If True, log the fine-tuning process to Weights & Biases.
         Log in via the CLI if not already done: `wandb login`.
+    wandb_init_kwargs: dict | None
+        Keyword arguments for `wandb.init`, required if use_wandb is True and
+        use_multiple_gpus spawns processes, as those do not share the wandb run of
+        this process. The main spawned process then logs to its own run.
     use_sklearn_interface_for_validation: bool
         If True, will create and run TabPFN default sklearn preprocessing pipeline
         for validation metric calculation.
@@ -131,24 +166,57 @@ def fine_tune_tabpfn(
         The passed model should not be fitted, it is used to configure the
         preprocessing pipeline.
     """
+    fine_tune_kwargs = dict(locals())
     st_time = time.time()
+    # Resolve the device (topology) once instead of comparing enums in the loop.
+    is_gpu = device == SupportedDevice.GPU
+    n_gpus = torch.cuda.device_count() if is_gpu else 0
+    # Only use an existing process group if asked to, e.g., independent fine-tuning
+    #   runs per process must not share gradients or early stopping decisions.
+    is_distributed = (
+        use_multiple_gpus
+        and is_gpu
+        and torch.distributed.is_available()
+        and torch.distributed.is_initialized()
+    )
+    if (not is_distributed) and use_multiple_gpus and (n_gpus > 1):
+        if use_wandb and (wandb_init_kwargs is None):
+            raise ValueError(
+                "use_wandb with use_multiple_gpus requires wandb_init_kwargs, "
+                "as the spawned processes do not share the wandb run of this process.",
+            )
+        # Re-enter this function in one DistributedDataParallel process per GPU.
+        device_ids = (
+            list(range(n_gpus))
+            if multiple_device_ids is None
+            else [
+                d.index if isinstance(d, torch.device) else int(d)
+                for d in multiple_device_ids
+            ]
+        )
+        torch.multiprocessing.spawn(
+            _distributed_worker,
+            args=(device_ids, _get_free_port(), st_time, fine_tune_kwargs),
+            nprocs=len(device_ids),
+            join=True,
+        )
+        return
+    rank = torch.distributed.get_rank() if is_distributed else 0
+    is_main_process = rank == 0
 
-    # Coerce input data into pandas structures
-    if not isinstance(X_train, pd.DataFrame):
-        X_train = pd.DataFrame(X_train)
-
-    if not isinstance(y_train, pd.Series):
-        y_train = pd.Series(y_train)
+    # Coerce input data into contiguous float32 NumPy arrays (no copy for such arrays)
+    X_train = np.ascontiguousarray(X_train, dtype=np.float32)
+    y_train = np.ascontiguousarray(y_train, dtype=np.float32)
 
-    if X_val is not None and not isinstance(X_val, pd.DataFrame):
-        X_val = pd.DataFrame(X_val)
+    if X_val is not None:
+        X_val = np.ascontiguousarray(X_val, dtype=np.float32)
 
-    if y_val is not None and not isinstance(y_val, pd.Series):
-        y_val = pd.Series(y_val)
+    if y_val is not None:
+        y_val = np.ascontiguousarray(y_val, dtype=np.float32)
 
     # Control logging
-    logger.setLevel(logger_level)
-    disable_progress_bar = logger_level >= 20
+    logger.setLevel(logger_level if is_main_process else logging.WARNING)
+    disable_progress_bar = (logger_level >= 20) or (not is_main_process)
 
     # Control randomness
     rng = np.random.RandomState(random_seed)
@@ -161,12 +229,18 @@ def fine_tune_tabpfn(
     # Meta
     is_classification = task_type != TaskType.REGRESSION
     use_autocast = False
-    if device == SupportedDevice.GPU:
+    autocast_dtype = torch.float16
+    if is_gpu:
         # Autocast on CPU too slow for unsupported hardware + env: https://github.com/pytorch/pytorch/issues/118499
         use_autocast = True
+        # BF16 has the same range as FP32, so no grad scaling is needed. Only use it
+        #   with native support (Ampere or newer), as `torch.cuda.is_bf16_supported()`
+        #   also counts emulated support.
+        if torch.cuda.get_device_capability()[0] >= 8:
+            autocast_dtype = torch.bfloat16
     # If True, it is likely that the first ~5 steps will have NaNs and no change
     #   The code below compensates for this fact.
-    use_grad_scaler = use_autocast
+    use_grad_scaler = use_autocast and (autocast_dtype == torch.float16)
 
     # Load base model
     if isinstance(path_to_base_model, str) and path_to_base_model == "auto":
@@ -184,17 +258,14 @@ def fine_tune_tabpfn(
     )
     model.criterion = criterion
     checkpoint_config = checkpoint_config.__dict__
-    is_data_parallel = False
-    if device == 'cuda' and use_multiple_gpus and torch.cuda.device_count() > 1:
-        model = DataParallel(model, device_ids=multiple_device_ids)
-        is_data_parallel = True
     model.to(device)
-    if use_wandb:
-        wandb.watch(model, log_freq=1, log="all")
 
     # Setup validation
     create_val_data = (X_val is None) and (y_val is None)
-    n_classes = len(np.unique(y_train)) if is_classification else None
+    if not is_classification:
+        n_classes = None
+    elif n_classes is None:
+        n_classes = get_n_classes(y_train)
     n_samples = len(X_train)
     if not create_val_data:
         n_samples += len(X_val)
@@ -223,9 +294,29 @@ def fine_tune_tabpfn(
         model=model,
         task_type=task_type,
         is_classification=is_classification,
-        is_data_parallel=is_data_parallel,
+        world_size=torch.distributed.get_world_size() if is_distributed else 1,
     )
     logger.debug(fts.report_str)
+    if fts.use_gradient_checkpointing:
+        # Recompute the activations of each transformer layer during the backward pass
+        #   instead of storing them. Forward passes without grad (validation) are
+        #   unaffected.
+        unwrap_model(model).transformer_encoder.recompute_each_layer = True
+    if fts.compile_model and is_gpu:
+        # Fuse kernels and capture CUDA graphs for the (static-shape) training steps.
+        #   Validation uses the uncompiled model (see unwrap_model), as its shapes
+        #   differ.
+        model = torch.compile(model, mode="reduce-overhead", dynamic=False)
+    if is_distributed:
+        # static_graph lets DDP overlap the bucketed allreduce with the backward pass.
+        model = DistributedDataParallel(
+            model,
+            device_ids=[torch.cuda.current_device()],
+            gradient_as_bucket_view=True,
+            static_graph=True,
+        )
+    if use_wandb and is_main_process:
+        wandb.watch(model, log_freq=1, log="all")
 
     # Setup Forward Pass Function
     categorical_features_index = (
@@ -242,8 +333,8 @@ def fine_tune_tabpfn(
         n_classes=n_classes,
         categorical_features_index=categorical_features_index,
         use_autocast=use_autocast,
+        autocast_dtype=autocast_dtype,
         device=device,
-        is_data_parallel=is_data_parallel,
     )
 
     # Setup validation function
@@ -257,16 +348,19 @@ def fine_tune_tabpfn(
             model_for_validation = TabPFNRegressor() if task_type == TaskType.REGRESSION else TabPFNClassifier()
         # this is required as memory_saving_mode can not be used during training
         model_for_validation.memory_saving_mode = False
+    # The sklearn interface validates on NumPy arrays, so keep its data on the host.
+    val_data_device = (
+        SupportedDevice.CPU if use_sklearn_interface_for_validation else device
+    )
+    val_data = ValidationData(
+        X_train=to_validation_tensor(data=X_train, device=val_data_device),
+        y_train=to_validation_tensor(data=y_train, device=val_data_device),
+        X_val=to_validation_tensor(data=X_val, device=val_data_device),
+        y_val=to_validation_tensor(data=y_val, device=val_data_device),
+    )
     validate_tabpfn_fn = partial(
         validate_tabpfn,
-        X_train=torch.tensor(X_train.values)
-        .reshape(X_train.shape[0], 1, X_train.shape[1])
-        .float(),
-        y_train=torch.tensor(y_train.values).reshape(y_train.shape[0], 1, 1).float(),
-        X_val=torch.tensor(X_val.values)
-        .reshape(X_val.shape[0], 1, X_val.shape[1])
-        .float(),
-        y_val=torch.tensor(y_val.values).reshape(y_val.shape[0], 1, 1).float(),
+        val_data=val_data,
         validation_metric=validation_metric,
         model_forward_fn=model_forward_fn,
         task_type=task_type,
@@ -277,14 +371,18 @@ def fine_tune_tabpfn(
     model.eval()
     optimizer.eval()
     with torch.no_grad():
+        # Validate without the DDP wrapper, every process validates the same model.
         best_validation_loss = validate_tabpfn_fn(
-            model=model,
+            model=unwrap_model(model),
         )  # Initial validation loss
+    if is_distributed:
+        best_validation_loss = _broadcast_from_main_process(best_validation_loss)
     adaptive_es.update(cur_round=0, is_best=True)
 
     # Setup step results trace
-    step_results_over_time = []
-    step_results_over_time.append(
+    trace = FineTuneTrace(max_steps=fts.max_steps + 1)
+    best_step = 0
+    trace.append(
         FineTuneStepResults(
             step_index=0,
             best_validation_loss=best_validation_loss,
@@ -295,22 +393,43 @@ def fine_tune_tabpfn(
             validation_loss=best_validation_loss,
             patience_left=adaptive_es.remaining_patience(cur_round=0),
             time_left=time_limit,
-            device_utilization=torch.cuda.utilization(device=device)
-            if device == SupportedDevice.GPU
-            else 0.0,
+            device_utilization=get_device_utilization() if is_gpu else 0.0,
             step_with_update=False,
             optimizer_step_skipped=False,
             grad_norm_before_clip=-1,
         ),
     )
-    torch.save(
-        dict(
-            state_dict=model.module.state_dict() if is_data_parallel else model.state_dict(),
-            config=checkpoint_config),
-        str(save_path_to_fine_tuned_model),
-    )
+    if is_main_process:
+        save_model(
+            model=model,
+            save_path_to_fine_tuned_model=str(save_path_to_fine_tuned_model),
+            checkpoint_config=checkpoint_config,
+        )
     logger.debug(f"Initial validation loss: {best_validation_loss}")
 
+    # Setup background work: checkpoint saving and (optionally) validation
+    background_executor = ThreadPoolExecutor(max_workers=1)
+    model_saver = (
+        BackgroundModelSaver(
+            model=model,
+            save_path_to_fine_tuned_model=save_path_to_fine_tuned_model,
+            checkpoint_config=checkpoint_config,
+            executor=background_executor,
+        )
+        if is_main_process
+        else None
+    )
+    background_validator = (
+        BackgroundValidator(
+            model=model,
+            validate_fn=validate_tabpfn_fn,
+            executor=background_executor,
+            device=device,
+        )
+        if fts.validate_in_background
+        else None
+    )
+
     # Setup data loader
     data_loader = get_data_loader(
         X_train=X_train,
@@ -320,6 +439,8 @@ def fine_tune_tabpfn(
         torch_rng=torch_rng,
         is_classification=is_classification,
         num_workers=fts.data_loader_workers,
+        pin_memory=is_gpu,
+        rank=rank,
     )
     # Setup progress bar
     iter_steps_pbar = tqdm(
@@ -336,8 +457,10 @@ def fine_tune_tabpfn(
     gradient_accumulation_steps = (
         fts.update_every_n_steps if fts.update_every_n_steps > 1 else None
     )
-    optimizer.zero_grad()
+    optimizer.zero_grad(set_to_none=True)
     skipped_steps = 0
+    unlogged_step_results = []
+    validation_loss = best_validation_loss
     for step_i, batch_data in iter_steps_pbar:
         # Check for updating
         update_now = (step_i + 1) % fts.update_every_n_steps == 0
@@ -345,12 +468,13 @@ def fine_tune_tabpfn(
 
         model.train()
         optimizer.train()
+        batch_data = unpack_batch(batch_data, device=device)
         step_results = _fine_tune_step(
             batch_X_train=batch_data["X_train"],
             batch_X_test=batch_data["X_test"],
             batch_y_train=batch_data["y_train"],
             batch_y_test=batch_data["y_test"],
-            device=device,
+            is_gpu=is_gpu,
             optimizer=optimizer,
             model_forward_fn=model_forward_fn,
             loss_fn=fts.loss_fn,
@@ -367,35 +491,70 @@ def fine_tune_tabpfn(
             skipped_steps += 1
 
         # -- Validate & save model
+        cur_round = (step_i - skipped_steps) // fts.update_every_n_steps
+        validation_result = None
         if validate_now:
             model.eval()
             optimizer.eval()
-            with torch.no_grad():
-                validation_loss = validate_tabpfn_fn(model=model)
+            if background_validator is None:
+                with torch.no_grad():
+                    validation_result = (
+                        cur_round,
+                        step_i,
+                        validate_tabpfn_fn(model=unwrap_model(model)),
+                    )
+                validated_model = model
+            else:
+                # Use the result for the snapshot from the previous validation step.
+                validation_result = background_validator.result()
+                validated_model = background_validator.model
+
+        if validation_result is not None:
+            validated_round, validated_step, validation_loss = validation_result
+            if is_distributed:
+                validation_loss = _broadcast_from_main_process(validation_loss)
 
             # -- Check tuning state
             is_best = validation_loss < best_validation_loss
             early_stop_no_imp = adaptive_es.update(
-                cur_round=(step_i - skipped_steps) // fts.update_every_n_steps,
+                cur_round=validated_round,
                 is_best=is_best,
             )
             if is_best:
                 best_validation_loss = validation_loss
-                torch.save(
-                    dict(
-                        state_dict=model.module.state_dict() if is_data_parallel else model.state_dict(),
-                        config=checkpoint_config),
-                    str(save_path_to_fine_tuned_model),
-                )
+                best_step = validated_step
+                if is_main_process:
+                    model_saver.save(model=validated_model)
         else:
-            validation_loss = step_results_over_time[-1].validation_loss
+            # Keep the last validation loss
             early_stop_no_imp = False
 
+        if (
+            validate_now
+            and (background_validator is not None)
+            and (not early_stop_no_imp)
+        ):
+            background_validator.submit(
+                model=model,
+                cur_round=cur_round,
+                step_index=step_i,
+            )
+
         time_spent = time.time() - st_time
         time_left = time_limit - time_spent
-        early_stop_no_time = (time_left <= 0) or (
-            time_left <= ((time_spent / step_i) * 1.1)
-        )
+        if not is_distributed:
+            early_stop_no_time = (time_left <= 0) or (
+                time_left <= ((time_spent / step_i) * 1.1)
+            )
+        elif (step_i + 1) % fts.validate_every_n_steps == 0:
+            # All processes must stop at the same step, so only decide at validation
+            #   steps (which sync anyhow) and keep time for all steps until the next.
+            early_stop_no_time = (time_left <= 0) or (
+                time_left <= ((time_spent / step_i) * 1.1 * fts.validate_every_n_steps)
+            )
+            early_stop_no_time = _broadcast_from_main_process(early_stop_no_time)
+        else:
+            early_stop_no_time = False
 
         # -- Track Progress
         step_results = step_results.register_meta_state(
@@ -406,24 +565,22 @@ def fine_tune_tabpfn(
                 best_validation_loss,
             ),
             patience_left=adaptive_es.remaining_patience(
-                cur_round=(step_i - skipped_steps) // fts.update_every_n_steps,
+                cur_round=cur_round,
             ),
             time_left=time_left,
         )
-        if use_wandb:
-            wandb.log(
-                {
-                    "train_loss": step_results.training_loss,
-                    "val_loss": step_results.validation_loss,
-                    "grad_norm": step_results.grad_norm_before_clip,
-                },
+        unlogged_step_results.append(step_results)
+        if validate_now or early_stop_no_imp or early_stop_no_time:
+            # Logging requires a sync with the device, so only log when we sync anyhow.
+            _log_step_results(
+                step_results=unlogged_step_results,
+                trace=trace,
+                iter_steps_pbar=iter_steps_pbar,
+                use_wandb=use_wandb and is_main_process,
             )
-        iter_steps_pbar.set_postfix(step_results.to_results_dict())
-        step_results_over_time.append(step_results)
-
-        # Fix Initial training loss
-        if step_i == 1:
-            step_results_over_time[0].training_loss = step_results.training_loss
+        if (validation_result is not None) and (validated_step < step_i):
+            # A background validation belongs to the (traced) step of its snapshot.
+            trace.validation_loss[validated_step:] = validation_loss
 
         # -- Early Stopping
         # Break from adaptive early stopping
@@ -431,15 +588,119 @@ def fine_tune_tabpfn(
         if early_stop_no_imp or early_stop_no_time:
             break
 
-    _tore_down_tuning(
-        task_type=task_type,
-        step_results_over_time=step_results_over_time,
-        fts=fts,
-        early_stop_no_imp=early_stop_no_imp,
-        early_stop_no_time=early_stop_no_time,
-        show_training_curve=show_training_curve,
-        st_time=st_time,
+    _log_step_results(
+        step_results=unlogged_step_results,
+        trace=trace,
+        iter_steps_pbar=iter_steps_pbar,
+        use_wandb=use_wandb and is_main_process,
+    )
+    # Fix Initial training loss
+    if trace.n_steps > 1:
+        trace.training_loss[0] = trace.training_loss[1]
+
+    # Collect the last validation running in the background
+    validation_result = (
+        background_validator.result() if background_validator is not None else None
+    )
+    if validation_result is not None:
+        _, validated_step, validation_loss = validation_result
+        if is_distributed:
+            validation_loss = _broadcast_from_main_process(validation_loss)
+        trace.validation_loss[validated_step:] = validation_loss
+        if validation_loss < best_validation_loss:
+            best_validation_loss = validation_loss
+            best_step = validated_step
+            if is_main_process:
+                model_saver.save(model=background_validator.model)
+    # Make sure the best model is on disk (and surface errors from saving)
+    if is_main_process:
+        model_saver.wait()
+    background_executor.shutdown(wait=True)
+
+    if is_main_process:
+        _tore_down_tuning(
+            task_type=task_type,
+            trace=trace,
+            best_step=best_step,
+            best_validation_loss=best_validation_loss,
+            fts=fts,
+            early_stop_no_imp=early_stop_no_imp,
+            early_stop_no_time=early_stop_no_time,
+            show_training_curve=show_training_curve,
+            st_time=st_time,
+        )
+
+
+def _log_step_results(
+    *,
+    step_results: list[FineTuneStepResults],
+    trace: FineTuneTrace,
+    iter_steps_pbar: tqdm,
+    use_wandb: bool,
+) -> None:
+    """Log and trace the step results that were not logged yet and clear the list."""
+    if not step_results:
+        return
+
+    materialize_step_results(step_results)
+    for step_results_i in step_results:
+        trace.append(step_results_i)
+        if use_wandb:
+            wandb.log(
+                {
+                    "train_loss": step_results_i.training_loss,
+                    "val_loss": step_results_i.validation_loss,
+                    "grad_norm": step_results_i.grad_norm_before_clip,
+                },
+            )
+    iter_steps_pbar.set_postfix(step_results[-1].to_results_dict())
+    step_results.clear()
+
+
+def _get_free_port() -> int:
+    """Get a free port on the local host, such that parallel runs do not collide."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("localhost", 0))
+        return sock.getsockname()[1]
+
+
+def _distributed_worker(
+    rank: int,
+    device_ids: list[int],
+    master_port: int,
+    st_time: float,
+    fine_tune_kwargs: dict,
+) -> None:
+    """Entry point of one DistributedDataParallel fine-tuning process (one per GPU).
+
+    The time spent for spawning this process and setting up the process group counts
+    towards the time limit, measured from `st_time` of the parent process.
+    """
+    torch.cuda.set_device(device_ids[rank])
+    torch.distributed.init_process_group(
+        backend="nccl",
+        init_method=f"tcp://localhost:{master_port}",
+        rank=rank,
+        world_size=len(device_ids),
     )
+    # Only the main process logs to wandb
+    use_wandb_run = fine_tune_kwargs["use_wandb"] and (rank == 0)
+    if use_wandb_run:
+        wandb.init(**fine_tune_kwargs["wandb_init_kwargs"])
+    time_limit = fine_tune_kwargs["time_limit"] - (time.time() - st_time)
+    try:
+        fine_tune_tabpfn(**dict(fine_tune_kwargs, time_limit=time_limit))
+    finally:
+        if use_wandb_run:
+            wandb.finish()
+        torch.distributed.destroy_process_group()
+
+
+def _broadcast_from_main_process(value: float | bool) -> float | bool:
+    """Use the value of the main process in all processes to keep decisions in sync."""
+    buffer = [value]
+    torch.distributed.broadcast_object_list(buffer, src=0)
+    return buffer[0]
 
 
 def _model_forward(
@@ -452,10 +713,9 @@ def _model_forward(
     softmax_temperature: torch.Tensor | None = None,
     categorical_features_index: list[torch.Tensor] | None,
     use_autocast: bool = True,
+    autocast_dtype: torch.dtype = torch.float16,
     forward_for_validation: bool = False,
     device: SupportedDevice,
-    outer_loop_autocast: bool = False,
-    is_data_parallel: bool,
 ) -> torch.Tensor:
     """Wrapper function to perform a forward pass with a TabPFN model.
 
@@ -479,6 +739,9 @@ def _model_forward(
     use_autocast: bool
         Whether to use FP16 precision for the forward pass.
         This is required for flash attention!
+    autocast_dtype: torch.dtype
+        The lower precision dtype used by autocast, i.e., torch.float16 or
+        torch.bfloat16.
     forward_for_validation: boo
         If True, this indicates that this is a forward pass for a validation score.
         This means that a regression model will return predictions instead of logits for the bar distribution.
@@ -499,41 +762,60 @@ def _model_forward(
         std = y_train.std(dim=0)
         y_train = (y_train - mean) / std
 
-    forward_kwargs = dict(
-        train_x=X_train,
-        train_y=y_train,
-        test_x=X_test,
-        categorical_inds=categorical_features_index,
+    # Autocast only the model call, everything before and after runs in FP32.
+    with autocast(device_type=device, dtype=autocast_dtype, enabled=use_autocast):
+        pred_logits = model(
+            train_x=X_train,
+            train_y=y_train,
+            test_x=X_test,
+            categorical_inds=categorical_features_index,
+        )
+
+    pred_logits = _scale_logits(
+        pred_logits=pred_logits,
+        n_classes=n_classes,
+        softmax_temperature=softmax_temperature,
     )
 
-    if outer_loop_autocast:
-        pred_logits = model(**forward_kwargs)
-    else:
-        with autocast(device_type=device, enabled=use_autocast):
-            pred_logits = model(**forward_kwargs)
+    if not is_classification and forward_for_validation:
+        # The mean of the bar distribution is affine-equivariant in its borders
+        #   (std > 0), so predicting in the z-normalized space and re-scaling afterward
+        #   equals the mean of the bar distribution with borders scaled per dataset.
+        #   This works batched in one pass.
+        # (n_samples, batch_size)
+        pred_logits = unwrap_model(model).criterion.mean(pred_logits)
+        pred_logits = pred_logits * std.view(1, -1) + mean.view(1, -1)
 
-    if is_classification:
-        pred_logits = pred_logits[:, :, :n_classes].float()
+    return pred_logits
 
-        if softmax_temperature is not None:
-            pred_logits = pred_logits / softmax_temperature
-    else:
-        # Need to go step-wise over batch size as bar_dist.mean() does not support batched output.
-        pred_logits = pred_logits.float()
-
-        if softmax_temperature is not None:
-            pred_logits = pred_logits / softmax_temperature
-
-        if forward_for_validation:
-            new_pred_logits = []
-            for batch_i in range(pred_logits.shape[1]):
-                bar_dist = deepcopy(model.module.criterion if is_data_parallel else model.criterion)
-                bar_dist.borders = (
-                    bar_dist.borders * std[batch_i] + mean[batch_i]
-                ).float()
-                new_pred_logits.append(bar_dist.mean(pred_logits[:, batch_i, :]))
-            pred_logits = torch.stack(new_pred_logits, dim=-1)
 
+def _scale_logits(
+    *,
+    pred_logits: torch.Tensor,
+    n_classes: int | None,
+    softmax_temperature: torch.Tensor | None,
+) -> torch.Tensor:
+    """Select the logits of the classes (if needed), cast them to FP32, and apply the
+    softmax temperature.
+
+    Arguments:
+    ----------
+    pred_logits: torch.Tensor
+        The raw output of the model, (n_samples, batch_size, n_outputs).
+    n_classes: int | None
+        The number of classes for classification tasks, otherwise None.
+    softmax_temperature: torch.Tensor | None
+        The softmax temperature for the model. If None, no scaling is applied.
+    """
+    # Slicing all outputs would only add a strided view, so skip it.
+    if n_classes is not None and n_classes != pred_logits.shape[-1]:
+        pred_logits = pred_logits[..., :n_classes]
+    # No-op if the model already returned FP32.
+    pred_logits = pred_logits.float()
+
+    if softmax_temperature is not None:
+        # Multiply by the scalar inverse instead of dividing all logits by it.
+        pred_logits = pred_logits * softmax_temperature.reciprocal()
     return pred_logits
 
 
@@ -543,7 +825,7 @@ def _fine_tune_step(
     batch_X_test: torch.Tensor,
     batch_y_train: torch.Tensor,
     batch_y_test: torch.Tensor,
-    device: SupportedDevice,
+    is_gpu: bool,
     model: PerFeatureTransformer,
     optimizer: Optimizer,
     model_forward_fn: Callable,
@@ -557,15 +839,16 @@ def _fine_tune_step(
     Arguments:
     ----------
     batch_X_train: torch.Tensor
-        The training features.
+        The training features. All batch tensors are expected on the fine-tuning
+        device in (n_samples, batch_size, ...) layout, see `unpack_batch`.
     batch_X_test: torch.Tensor
         The test features.
     batch_y_train: torch.Tensor
         The training target.
     batch_y_test: torch.Tensor
         The test target.
-    device: SupportedDevice
-        The device to use for fine-tuning.
+    is_gpu: bool
+        Whether fine-tuning runs on a GPU.
     model: PerFeatureTransformer
         The model to fine-tune.
     optimizer: torch.optim.Optimizer
@@ -575,7 +858,7 @@ def _fine_tune_step(
     loss_fn: _Loss
         The loss function to use.
     scaler: GradScaler
-        The gradient scaler to use for FP16 precision.
+        The gradient scaler to use for FP16 precision. Disabled for BF16 or FP32.
     step_with_update: bool
         Whether the optimizer, lr scheduler, and grad scaler shall be updated in this step.
     gradient_accumulation_steps: int
@@ -588,57 +871,64 @@ def _fine_tune_step(
     step_results: FineTuneStepResults
         The results of the fine-tuning step.
     """
-    # Move batch dimensions
-    batch_X_train = torch.movedim(batch_X_train, 0, 1).to(device)
-    batch_X_test = torch.movedim(batch_X_test, 0, 1).to(device)
-    batch_y_train = torch.movedim(batch_y_train, 0, 1).to(device)
-    batch_y_test = torch.movedim(batch_y_test, 0, 1).to(device)
-
-    # Forward Mixed Precision
-    with autocast(device_type=device, enabled=scaler.is_enabled()):
-        pred_logits = model_forward_fn(  # autocast in model_forward_fn
+    # Only sync gradients across DDP processes in steps that update the model
+    grad_sync_context = (
+        model.no_sync()
+        if isinstance(model, DistributedDataParallel) and (not step_with_update)
+        else nullcontext()
+    )
+    with grad_sync_context:
+        # Forward, Mixed Precision only for the model call (see model_forward_fn)
+        pred_logits = model_forward_fn(
             model=model,
             X_train=batch_X_train,
             y_train=batch_y_train,
             X_test=batch_X_test,
-            outer_loop_autocast=True,
         )
         loss = compute_loss(loss_fn=loss_fn, logits=pred_logits, target=batch_y_test)
 
         if gradient_accumulation_steps is not None:
             loss = loss / gradient_accumulation_steps
 
-    # Backward, Scaled for Mixed Precision
-    scaler.scale(loss).backward()
+        # Backward, Scaled for FP16 Mixed Precision
+        if scaler.is_enabled():
+            scaler.scale(loss).backward()
+        else:
+            loss.backward()
 
     # Update
     optimizer_step_skipped = False
     grad_norm = -1
     if step_with_update:
         # Clip grads
-        scaler.unscale_(optimizer)
+        if scaler.is_enabled():
+            scaler.unscale_(optimizer)
         grad_norm = torch.nn.utils.clip_grad_norm_(
             model.parameters(),
             max_norm=1.0,
             error_if_nonfinite=False,
-        ).item()
-
-        # Step optimizer and scaler
-        org_scale = scaler.get_scale()
-        scaler.step(optimizer)
-        scaler.update()
-        optimizer_step_skipped = org_scale > scaler.get_scale()
+            foreach=True,
+        ).detach()
+
+        # Step optimizer (and scaler)
+        if scaler.is_enabled():
+            org_scale = scaler.get_scale()
+            scaler.step(optimizer)
+            scaler.update()
+            optimizer_step_skipped = org_scale > scaler.get_scale()
+        else:
+            optimizer.step()
 
         # Zero grad here due to gradient accumulation
-        optimizer.zero_grad()
+        optimizer.zero_grad(set_to_none=True)
 
+    # Keep loss and grad norm on the device to avoid host syncs,
+    #   see `materialize_step_results`.
     return FineTuneStepResults(
-        training_loss=loss.item()
+        training_loss=loss.detach()
         if gradient_accumulation_steps is None
-        else loss.item() * gradient_accumulation_steps,
-        device_utilization=torch.cuda.utilization(device=device)
-        if device == SupportedDevice.GPU
-        else 0.0,
+        else loss.detach() * gradient_accumulation_steps,
+        device_utilization=get_device_utilization() if is_gpu else 0.0,
         step_with_update=step_with_update,
         optimizer_step_skipped=optimizer_step_skipped,
         grad_norm_before_clip=grad_norm,
@@ -650,7 +940,8 @@ def _setup_tuning(
     # Learning HPs
     learning_rate: float = 1e-8,
     batch_size: int = 1,
-    update_every_n_steps: int = 1,
+    update_every_n_steps: int | None = None,
+    effective_batch_size: int | None = None,
     validate_every_n_steps: int = 1,
     max_steps: int = 10000,
     adaptive_rate: float = 0.2,
@@ -658,12 +949,25 @@ def _setup_tuning(
     min_patience: int = 20,
     max_patience: int = 100,
     data_loader_workers: int = 1,
+    use_gradient_checkpointing: bool = False,
+    validate_in_background: bool = False,
+    compile_model: bool = False,
     # Metadata
     model: PerFeatureTransformer,
     task_type: TaskType,
     is_classification: bool,
-    is_data_parallel: bool,
+    world_size: int = 1,
 ) -> FineTuneSetup:
+    if effective_batch_size is not None:
+        if update_every_n_steps is not None:
+            raise ValueError(
+                "Only one of update_every_n_steps and effective_batch_size can be set.",
+            )
+        # Emulate a larger batch size via gradient accumulation (per DDP process)
+        update_every_n_steps = max(1, effective_batch_size // (batch_size * world_size))
+    elif update_every_n_steps is None:
+        update_every_n_steps = 1
+
     return FineTuneSetup(
         optimizer=AdamWScheduleFree(model.parameters(), lr=learning_rate),
         max_steps=max_steps,
@@ -674,13 +978,18 @@ def _setup_tuning(
             max_patience=max_patience,
         ),
         update_every_n_steps=update_every_n_steps,
+        effective_batch_size=batch_size * world_size * update_every_n_steps,
         batch_size=batch_size,
         validate_every_n_steps=validate_every_n_steps,
         data_loader_workers=data_loader_workers,
+        use_gradient_checkpointing=use_gradient_checkpointing,
+        validate_in_background=validate_in_background,
+        compile_model=compile_model,
         loss_fn=get_loss(
             task_type=task_type,
-            borders=None if is_classification else
-                    (model.module.criterion.borders if is_data_parallel else model.criterion.borders),
+            borders=(
+                None if is_classification else unwrap_model(model).criterion.borders
+            ),
         ),
     )
 
@@ -691,7 +1000,9 @@ def _tore_down_tuning(
     early_stop_no_time: bool,
     show_training_curve: bool,
     st_time: float,
-    step_results_over_time: list[FineTuneStepResults],
+    trace: FineTuneTrace,
+    best_step: int,
+    best_validation_loss: float,
     fts: FineTuneSetup,
     task_type: TaskType,
 ) -> None:
@@ -705,16 +1016,15 @@ def _tore_down_tuning(
         logger.log(10, es_reason)
 
     # -- Final Report
-    best_step = np.argmin([x.validation_loss for x in step_results_over_time])
     fine_tuning_report = f"""=== Fine-Tuning Report for TabPFN ===
         \tTotal Time Spent: {time.time() - st_time}
-        \tInitial Validation Loss: \t {step_results_over_time[0].validation_loss}
-        \tBest Validation Loss: \t {step_results_over_time[-1].best_validation_loss}
-        \tTotal Steps: {len(step_results_over_time)}
+        \tInitial Validation Loss: \t {trace.validation_loss[0]}
+        \tBest Validation Loss: \t {best_validation_loss}
+        \tTotal Steps: {trace.n_steps}
         \tBest Step: {best_step}
         \tEarly Stopping Reason: {es_reason}
-        \tAvg. Time per Step: {(time.time() - st_time) / len(step_results_over_time)}
-        \tAvg. Device Utilization: {np.mean([step.device_utilization for step in step_results_over_time])}
+        \tAvg. Time per Step: {(time.time() - st_time) / trace.n_steps}
+        \tAvg. Device Utilization: {trace.device_utilization.mean()}
         """
     logger.info(fine_tuning_report)
 
@@ -723,15 +1033,13 @@ def _tore_down_tuning(
         import matplotlib.pyplot as plt
         import seaborn as sns
 
-        train_loss_over_time = [step.training_loss for step in step_results_over_time]
-        raw_train_loss_over_time = train_loss_over_time[:]
+        train_loss_over_time = trace.training_loss.copy()
+        raw_train_loss_over_time = trace.training_loss
         for i in range(1, len(train_loss_over_time) + 1):
             train_loss_over_time[i - 1] = np.mean(
                 raw_train_loss_over_time[max(0, i - fts.update_every_n_steps) : i],
             )
-        validation_loss_over_time = [
-            step.validation_loss for step in step_results_over_time
-        ]
+        validation_loss_over_time = trace.validation_loss
         plot_df = pd.DataFrame(
             {
                 "train_loss": train_loss_over_time,
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from contextlib import nullcontext
+from copy import deepcopy
+from typing import TYPE_CHECKING
+
+import torch
+from finetuning_scripts.constant_utils import SupportedDevice
+from finetuning_scripts.training_utils.model_utils import unwrap_model
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from concurrent.futures import Executor, Future
+
+    from tabpfn.model.transformer import PerFeatureTransformer
+
+
+class BackgroundValidator:
+    """Validate a snapshot of the model in a background thread while training continues.
+
+    On GPUs, the validation runs on a separate CUDA stream such that it overlaps with
+    the training steps on the default stream.
+
+    Arguments:
+    ----------
+    model: PerFeatureTransformer
+        The model to validate. Copied once to hold the snapshots of the weights.
+    validate_fn: Callable
+        The validation function, called with `model=<snapshot>`.
+    executor: Executor
+        The executor used to run the validation.
+    device: SupportedDevice
+        The device used for fine-tuning.
+    """
+
+    def __init__(
+        self,
+        *,
+        model: PerFeatureTransformer,
+        validate_fn: Callable,
+        executor: Executor,
+        device: SupportedDevice,
+    ):
+        self.model = deepcopy(unwrap_model(model)).eval()
+        self._validate_fn = validate_fn
+        self._executor = executor
+        self._stream = torch.cuda.Stream() if device == SupportedDevice.GPU else None
+        self._future: Future | None = None
+        self._cur_round: int | None = None
+        self._step_index: int | None = None
+
+    def submit(
+        self,
+        *,
+        model: PerFeatureTransformer,
+        cur_round: int,
+        step_index: int,
+    ) -> None:
+        """Snapshot the weights of `model` at step `step_index` and validate them."""
+        if self._future is not None:
+            raise RuntimeError("Retrieve the result of the pending validation first.")
+
+        with torch.no_grad():
+            self.model.load_state_dict(unwrap_model(model).state_dict())
+        if self._stream is not None:
+            # Only start validating after the snapshot copy on the default stream.
+            self._stream.wait_stream(torch.cuda.current_stream())
+
+        self._cur_round = cur_round
+        self._step_index = step_index
+        self._future = self._executor.submit(self._validate)
+
+    def result(self) -> tuple[int, int, float] | None:
+        """Wait for the pending validation.
+
+        Returns:
+        --------
+        The round and step for which the validation was submitted and the validation
+        loss, or None if no validation is pending.
+        """
+        if self._future is None:
+            return None
+        validation_loss = self._future.result()
+        self._future = None
+        return self._cur_round, self._step_index, validation_loss
+
+    def _validate(self) -> float:
+        stream_context = (
+            torch.cuda.stream(self._stream)
+            if self._stream is not None
+            else nullcontext()
+        )
+        # Grad mode and streams are thread-local, so set them in the background thread.
+        with stream_context, torch.no_grad():
+            return self._validate_fn(model=self.model)
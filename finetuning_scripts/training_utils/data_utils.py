@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import math
 
 import numpy as np
 import torch
@@ -8,9 +8,7 @@ from sklearn.model_selection import KFold, StratifiedKFold
 from torch.utils.data import DataLoader, Dataset
 
 RANDOM_SEED = 4213
-
-if TYPE_CHECKING:
-    import pandas as pd
+BATCH_KEYS = ("X_train", "X_test", "y_train", "y_test")
 
 
 class TabularDataset(Dataset):
@@ -32,6 +30,8 @@ class TabularDataset(Dataset):
         Whether the task is classification or regression.
     cross_val_splits: int
         Number of cross-validation splits.
+    seed: int
+        Seed for the generator of the splits.
     """
 
     def __init__(
@@ -42,20 +42,22 @@ class TabularDataset(Dataset):
         max_steps: int,
         is_classification: bool,
         cross_val_splits: int | None = 10,
+        seed: int = RANDOM_SEED,
     ):
         self.X_train = X_train
         self.y_train = y_train
         self.max_steps = max_steps
         self.cross_val_splits = cross_val_splits
         self.is_classification = is_classification
+        self.seed = seed
         self._splits_generator = self.splits_generator(
             X_train=X_train,
             y_train=y_train,
             cross_val_splits=cross_val_splits,
             stratify_split=is_classification,
-            seed=RANDOM_SEED,
+            seed=seed,
         )
-        self._rng = np.random.RandomState(RANDOM_SEED)
+        self._rng = np.random.RandomState(seed)
 
     @staticmethod
     def splits_generator(
@@ -93,7 +95,7 @@ class TabularDataset(Dataset):
             y_train=self.y_train,
             cross_val_splits=self.cross_val_splits,
             stratify_split=self.is_classification,
-            seed=RANDOM_SEED,
+            seed=self.seed,
         )
 
     def __len__(self):
@@ -123,15 +125,69 @@ class TabularDataset(Dataset):
         )
 
 
+def get_n_classes(y: np.ndarray) -> int:
+    """Get the number of classes of a classification target.
+
+    For (dense) non-negative integer labels, as expected by TabPFN, the classes are
+    counted with np.bincount in O(N) instead of sorting all labels with np.unique.
+    """
+    y_int = y.astype(np.int64)
+    if (y_int == y).all() and (y_int.min() >= 0) and (y_int.max() <= len(y)):
+        return int(np.count_nonzero(np.bincount(y_int)))
+    return len(np.unique(y))
+
+
+def collate_splits(batch: list[dict[str, torch.Tensor]]) -> dict:
+    """Stack the splits of a batch along dim 1 and pack them into one contiguous buffer.
+
+    The packed tensors are in (n_samples, batch_size, ...) layout as expected by TabPFN.
+    Packing allows to copy a batch to the device at once, see `unpack_batch`.
+    """
+    shapes = [
+        (len(batch[0][key]), len(batch), *batch[0][key].shape[1:]) for key in BATCH_KEYS
+    ]
+    sizes = [math.prod(shape) for shape in shapes]
+    buffer = torch.empty(sum(sizes), dtype=batch[0][BATCH_KEYS[0]].dtype)
+    for key, shape, out in zip(BATCH_KEYS, shapes, buffer.split(sizes), strict=True):
+        torch.stack([split[key] for split in batch], dim=1, out=out.view(shape))
+
+    return dict(buffer=buffer, shapes=shapes)
+
+
+def unpack_batch(
+    batch_data: dict,
+    *,
+    device: str,
+) -> dict[str, torch.Tensor]:
+    """Copy a batch from `collate_splits` to `device` at once and unpack it.
+
+    Returns:
+    --------
+    dict[str, torch.Tensor]
+        The contiguous (n_samples, batch_size, ...) tensors for X_train, X_test,
+        y_train, and y_test.
+    """
+    buffer = batch_data["buffer"].to(device, non_blocking=True)
+    shapes = batch_data["shapes"]
+    sizes = [math.prod(shape) for shape in shapes]
+    tensors = buffer.split(sizes)
+    return {
+        key: tensor.view(shape)
+        for key, shape, tensor in zip(BATCH_KEYS, shapes, tensors, strict=True)
+    }
+
+
 def get_data_loader(
     *,
-    X_train: pd.DataFrame,
-    y_train: pd.Series,
+    X_train: np.ndarray,
+    y_train: np.ndarray,
     max_steps: int,
     torch_rng: torch.Generator,
     batch_size: int,
     is_classification: bool,
     num_workers: int,
+    pin_memory: bool = False,
+    rank: int = 0,
 ) -> DataLoader:
     """Get data loader.
 
@@ -139,10 +195,10 @@ def get_data_loader(
 
     Arguments:
     ----------
-    X_train: pd.DataFrame
-        Input features.
-    y_train: pd.Series
-        Target labels.
+    X_train: np.ndarray
+        Input features as float32 array.
+    y_train: np.ndarray
+        Target labels as float32 array.
     max_steps: int
         Maximum number of steps (splits of the data).
     torch_rng: torch.Generator
@@ -153,19 +209,29 @@ def get_data_loader(
         Whether the task is classification or regression.
     num_workers: int
         Number of workers for data loader.
+    pin_memory: bool
+        Whether to load batches into pinned memory for asynchronous copies to the GPU.
+    rank: int
+        Rank of the process for distributed fine-tuning. Each rank draws different
+        splits.
 
     Returns:
     --------
     DataLoader
-        Data loader.
+        Data loader. Batches are packed by `collate_splits`, use `unpack_batch` to
+        get the tensors.
     """
-    X_train = torch.tensor(X_train.copy().values).float()
-    y_train = torch.tensor(y_train.copy().values).reshape(-1, 1).float()
+    # Zero-copy views for contiguous float32 arrays
+    X_train = torch.from_numpy(np.ascontiguousarray(X_train, dtype=np.float32))
+    y_train = torch.from_numpy(
+        np.ascontiguousarray(y_train, dtype=np.float32),
+    ).view(-1, 1)
     dataset = TabularDataset(
         X_train=X_train,
         y_train=y_train,
         max_steps=max_steps * batch_size,
         is_classification=is_classification,
+        seed=RANDOM_SEED + rank,
     )
 
     return DataLoader(
@@ -173,8 +239,10 @@ def get_data_loader(
         batch_size=batch_size,
         shuffle=False,
         num_workers=num_workers,
-        pin_memory=False,
+        collate_fn=collate_splits,
+        pin_memory=pin_memory,
         drop_last=True,
         generator=torch_rng,
-        persistent_workers=False,
+        persistent_workers=num_workers > 0,
+        prefetch_factor=max(2, 4 // num_workers) if num_workers > 0 else None,
     )
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import time
+
+import torch
+
+UTILIZATION_SAMPLE_INTERVAL = 1.0
+"""Minimal time in seconds between two queries of the device utilization."""
+
+_last_utilization: tuple[float, float] | None = None
+"""Timestamp and value of the last queried device utilization."""
+
+
+def get_device_utilization() -> float:
+    """Get the (cached) utilization of the current CUDA device in percent.
+
+    Querying NVML takes hundreds of microseconds, so the device is queried at most
+    once every `UTILIZATION_SAMPLE_INTERVAL` seconds. Otherwise, the last value is
+    returned.
+    """
+    global _last_utilization
+    now = time.monotonic()
+    if (_last_utilization is None) or (
+        now - _last_utilization[0] > UTILIZATION_SAMPLE_INTERVAL
+    ):
+        _last_utilization = (now, float(torch.cuda.utilization()))
+    return _last_utilization[1]
@@ -1,25 +1,108 @@
 from __future__ import annotations
 
+import os
+from collections import OrderedDict
 from pathlib import Path
 from typing import TYPE_CHECKING
 import torch
+from torch.nn.parallel import DistributedDataParallel
 if TYPE_CHECKING:
+    from concurrent.futures import Executor, Future
+
     from tabpfn.model.transformer import PerFeatureTransformer
     from torch.serialization import FILE_LIKE
 
 
+def unwrap_model(model: torch.nn.Module) -> PerFeatureTransformer:
+    """Return the TabPFN model underneath a DDP and/or torch.compile wrapper."""
+    if isinstance(model, DistributedDataParallel):
+        model = model.module
+    # torch.compile wraps the model into an OptimizedModule holding the original model.
+    return getattr(model, "_orig_mod", model)
+
+
 def save_model(
     *,
     model: PerFeatureTransformer,
     save_path_to_fine_tuned_model: FILE_LIKE,
     checkpoint_config: dict,
-    is_data_parallel: bool = False,
 ) -> None:
     """Save the fine-tuned model to disk in a TabPFN-readable checkpoint format."""
     # -- Save fine-tuned model
     torch.save(
         dict(
-            state_dict=model.module.state_dict() if is_data_parallel else model.state_dict(),
+            state_dict=unwrap_model(model).state_dict(),
             config=checkpoint_config),
         f=save_path_to_fine_tuned_model,
     )
+
+
+class BackgroundModelSaver:
+    """Save the fine-tuned model like `save_model`, but in a background thread.
+
+    The weights are copied into a CPU buffer that is allocated once (pinned for GPU
+    weights) and reused for every save. Hence, saving only enqueues the copy from the
+    device, while the copy, serialization, and disk I/O overlap with training.
+
+    Arguments:
+    ----------
+    model: PerFeatureTransformer
+        The model to save, used to allocate the buffer.
+    save_path_to_fine_tuned_model: FILE_LIKE
+        Output path to save the fine-tuned model.
+    checkpoint_config: dict
+        The config stored with the checkpoint.
+    executor: Executor
+        The executor used to write the checkpoint.
+    """
+
+    def __init__(
+        self,
+        *,
+        model: PerFeatureTransformer,
+        save_path_to_fine_tuned_model: FILE_LIKE,
+        checkpoint_config: dict,
+        executor: Executor,
+    ):
+        self._save_path = os.fspath(save_path_to_fine_tuned_model)
+        self._checkpoint_config = checkpoint_config
+        self._executor = executor
+        self._future: Future | None = None
+
+        state_dict = unwrap_model(model).state_dict()
+        # Same type and metadata (module versions) as the state dict, such that the
+        #   checkpoint matches the one from `save_model`.
+        self._buffer = OrderedDict(
+            (k, torch.empty(v.shape, dtype=v.dtype, device="cpu", pin_memory=v.is_cuda))
+            for k, v in state_dict.items()
+        )
+        self._buffer._metadata = state_dict._metadata
+        self._on_gpu = any(v.is_cuda for v in state_dict.values())
+
+    def save(self, *, model: PerFeatureTransformer) -> None:
+        """Copy the weights of `model` to the buffer and save them in the background."""
+        # The buffer is reused, so the previous save must be finished.
+        self.wait()
+
+        for k, v in unwrap_model(model).state_dict().items():
+            self._buffer[k].copy_(v, non_blocking=True)
+        copy_done = None
+        if self._on_gpu:
+            copy_done = torch.cuda.Event()
+            copy_done.record()
+
+        self._future = self._executor.submit(self._save, copy_done)
+
+    def wait(self) -> None:
+        """Wait until the last save is on disk (and raise its errors)."""
+        if self._future is not None:
+            self._future.result()
+            self._future = None
+
+    def _save(self, copy_done: torch.cuda.Event | None) -> None:
+        if copy_done is not None:
+            copy_done.synchronize()
+        torch.save(
+            dict(state_dict=self._buffer, config=self._checkpoint_config),
+            self._save_path,
+        )
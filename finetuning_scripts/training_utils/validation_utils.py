@@ -3,13 +3,14 @@ from __future__ import annotations
 from collections.abc import Callable
 from typing import TYPE_CHECKING
 
+import numpy as np
 import torch
 from finetuning_scripts.constant_utils import SupportedDevice, TaskType
 from sklearn.model_selection import train_test_split
 
 if TYPE_CHECKING:
-    import numpy as np
     import pandas as pd
+    from finetuning_scripts.data_classes import ValidationData
     from finetuning_scripts.metric_utils.ag_metrics import Scorer
     from tabpfn.model.transformer import PerFeatureTransformer
     from tabpfn import TabPFNClassifier, TabPFNRegressor
@@ -48,12 +49,27 @@ def create_val_data(
     return X_train, X_val, y_train, y_val
 
 
+def to_validation_tensor(
+    *,
+    data: pd.DataFrame | pd.Series | np.ndarray,
+    device: SupportedDevice,
+) -> torch.Tensor:
+    """Convert validation data once to a (n_samples, 1, n_features) tensor on `device`.
+
+    The data is copied at most once into a contiguous float32 array and, for GPUs,
+    transferred via pinned memory. This avoids keeping host copies and re-transferring
+    them for every validation.
+    """
+    values = np.ascontiguousarray(data, dtype=np.float32)
+    tensor = torch.from_numpy(values).view(values.shape[0], 1, -1)
+    if device == SupportedDevice.GPU:
+        tensor = tensor.pin_memory().to(device, non_blocking=True)
+    return tensor
+
+
 def validate_tabpfn(
     *,
-    X_train: torch.Tensor,  # (n_samples, batch_size, n_features)
-    y_train: torch.Tensor,  # (n_samples, batch_size, 1)
-    X_val: torch.Tensor,  # (n_samples, batch_size, 1)
-    y_val: torch.Tensor,  # (n_samples, batch_size, 1)
+    val_data: ValidationData,
     validation_metric: Scorer,
     model: PerFeatureTransformer,
     model_forward_fn: Callable,
@@ -66,7 +82,15 @@ def validate_tabpfn(
 
     This code assumes that batch_size for validation is 1. Otherwise,
     need to write a loop, I guess?
+
+    The tensors in `val_data` are used as they are, i.e., they must already be on
+    `device`.
+    For `use_sklearn_interface_for_validation`, they must be on the CPU instead, such
+    that converting them to NumPy arrays does not copy them.
     """
+    X_train, y_train = val_data.X_train, val_data.y_train
+    X_val, y_val = val_data.X_val, val_data.y_val
+
     if use_sklearn_interface_for_validation:
         if model_for_validation is None:
             raise ValueError(
@@ -89,12 +113,13 @@ def validate_tabpfn(
 
         from tabpfn import TabPFNClassifier, TabPFNRegressor
 
-        X_val = X_val.cpu().detach().numpy()[:, 0, :]
-        y_true = y_val.flatten().cpu().detach().numpy()
+        # Views of the CPU tensors, no copy
+        X_val = X_val.numpy()[:, 0, :]
+        y_true = y_val.numpy().ravel()
 
         if not hasattr(model_for_validation, 'executor_'):
-            X_train = X_train.cpu().detach().numpy()[:, 0, :]
-            y_train = y_train.flatten().cpu().detach().numpy()
+            X_train = X_train.numpy()[:, 0, :]
+            y_train = y_train.numpy().ravel()
             model_for_validation.fit(X_train, y_train)
 
         model_for_validation.model_ = model
@@ -108,11 +133,6 @@ def validate_tabpfn(
         # model is moved to cpu after inference by the TabPFN* models
         model.to(device)
     else:
-        X_train = X_train.to(device)
-        y_train = y_train.to(device)
-        X_val = X_val.to(device)
-        y_val = y_val.to(device)
-
         pred_logits = model_forward_fn(
             model=model,
             X_train=X_train,
@@ -155,11 +175,6 @@ def validate_tabpfn(
             case _:
                 raise ValueError(f"Task type {task_type} not supported.")
 
-        X_train.cpu()
-        y_train.cpu()
-        X_val.cpu()
-        y_val.cpu()
-
     score = validation_metric(y_true=y_true, y_pred=y_pred)
 
     return validation_metric.convert_score_to_error(score=score)